@@ -1,15 +1,198 @@
 import asyncio
+import hashlib
+import json
+import os
 import re
+import sqlite3
+import sys
+import time
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+import httpx
 from loguru import logger
+from playwright.async_api import Error as PlaywrightError, Route, TimeoutError as PlaywrightTimeoutError
+
+# Sent with raw HTTP fetches so they get the same HTML a desktop browser does.
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+
+
+def configure_logging(verbose: bool = False):
+    """Log to stderr through a background thread, at DEBUG when verbose and $LOGLEVEL (default INFO) otherwise."""
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level="DEBUG" if verbose else os.getenv("LOGLEVEL", "INFO"),
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
+    )
+
+
+_TRAILING_NUM_RE = re.compile(r"\s*\d+\s*$")
+_LEADING_NUM_RE = re.compile(r"\s*(\d[\d,]*)")
 
 
 def clean_name(raw_name: str) -> str :
-    cleaned_name: str =  re.sub(r"\s*\d+\s*$", "", raw_name)
-    return cleaned_name
+    return _TRAILING_NUM_RE.sub("", raw_name)
+
+
+def parse_works_count(works_text: str) -> int:
+    """Turn text like '1,234 artworks' into 1234, or -1 if it has no leading number."""
+    m = _LEADING_NUM_RE.match(works_text)
+    return int(m.group(1).replace(",", "")) if m else -1
+
+
+def read_json_lines(path: Path) -> Iterator[Dict]:
+    """Yield the records of a JSON Lines file, skipping a line left truncated by a crash."""
+    if not path.exists():
+        return
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping unreadable line in {path}")
+
+
+class SeenStore:
+    """Art work urls and finished artists kept in sqlite, so reruns skip them without loading them all."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS seen(url TEXT PRIMARY KEY)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS done_artists(url TEXT PRIMARY KEY)")
+        self._db.commit()
+
+    def __contains__(self, url: str) -> bool:
+        return self._db.execute("SELECT 1 FROM seen WHERE url = ?", (url,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def add(self, url: str):
+        self.add_many([url])
+
+    def add_many(self, urls: Iterable[str]):
+        self._db.executemany("INSERT OR IGNORE INTO seen(url) VALUES (?)", ((url,) for url in urls))
+        self._db.commit()
+
+    def artist_done(self, url: str) -> bool:
+        return self._db.execute("SELECT 1 FROM done_artists WHERE url = ?", (url,)).fetchone() is not None
+
+    def mark_artist_done(self, url: str):
+        self._db.execute("INSERT OR IGNORE INTO done_artists(url) VALUES (?)", (url,))
+        self._db.commit()
+
+    def clear(self):
+        self._db.execute("DELETE FROM seen")
+        self._db.execute("DELETE FROM done_artists")
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+def open_seen_store(output_path: Path) -> SeenStore:
+    """Open the SeenStore kept next to a JSON Lines output, brought in line with what the file holds."""
+    seen = SeenStore(output_path.with_suffix(".seen.sqlite3"))
+    if not output_path.exists():
+        # A deleted output means a fresh run, not one where everything is already scraped.
+        seen.clear()
+    elif not len(seen):
+        seen.add_many(record["url"] for record in read_json_lines(output_path))
+    return seen
+
+
+async def bounded(semaphore: asyncio.Semaphore, coro):
+    """Await a coroutine while holding one slot of the given semaphore."""
+    async with semaphore:
+        return await coro
+
+
+class CachedRouter:
+    """On-disk cache of document/xhr/fetch responses, served through `route.fulfill`."""
+
+    cached_types = {"document", "xhr", "fetch"}
+    # The stored body is already decoded, so these no longer describe it.
+    dropped_headers = {"content-encoding", "content-length", "transfer-encoding"}
+
+    def __init__(self, cache_dir: Path = Path(".network-cache"), ttl: float = 24 * 3600):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _paths(self, request) -> Tuple[Path, Path]:
+        key = hashlib.sha1((request.method + request.url).encode("utf-8")).hexdigest()
+        host_dir = self.cache_dir / (urlparse(request.url).hostname or "unknown")
+        return host_dir / f"{key}.headers.json", host_dir / f"{key}.body.bin"
+
+    def _load(self, request) -> Optional[Tuple[Dict, bytes]]:
+        meta_path, body_path = self._paths(request)
+        try:
+            if time.time() - meta_path.stat().st_mtime > self.ttl:
+                # Expired entries are dropped here, so the cache does not keep growing between runs.
+                meta_path.unlink(missing_ok=True)
+                body_path.unlink(missing_ok=True)
+                return None
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            return meta, body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, request, status: int, headers: Dict, body: bytes):
+        meta_path, body_path = self._paths(request)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_text(json.dumps({"status": status, "headers": headers}), encoding="utf-8")
+
+    async def handle(self, route: Route) -> None:
+        """Fulfill the route from disk, or fetch it from the network and cache it."""
+        req = route.request
+        cached = await asyncio.to_thread(self._load, req)
+        if cached:
+            meta, body = cached
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+
+        try:
+            # Redirects are handed back to the page, so each hop is cached under its own url.
+            response = await route.fetch(max_redirects=0)
+            body = await response.body()
+        except PlaywrightError as e:
+            # Route handlers run as unawaited tasks, so an escaping error would leave the request hanging.
+            logger.warning(f"Could not fetch {req.url} for the cache, passing it through: {e}")
+            with suppress(PlaywrightError):  # the page itself may already be closed
+                await route.continue_()
+            return
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in self.dropped_headers}
+        if response.ok:
+            try:
+                await asyncio.to_thread(self._store, req, response.status, headers, body)
+            except OSError as e:
+                logger.warning(f"Could not cache {req.url}: {e}")
+        await route.fulfill(status=response.status, headers=headers, body=body)
+
 
+network_cache: Optional[CachedRouter] = None
 
-async def intercept_route(route):
-    """Abort requests for images, fonts, media, and tracking scripts."""
+
+def configure_network_cache(enabled: bool, cache_dir: Path = Path(".network-cache"), ttl: float = 24 * 3600):
+    """Turn the on-disk response cache used by `intercept_route` on or off; `ttl` is in seconds."""
+    global network_cache
+    network_cache = CachedRouter(cache_dir, ttl) if enabled else None
+
+
+async def intercept_route(route: Route) -> None:
+    """Abort requests for images, fonts, media, and tracking scripts; serve the rest from cache if enabled."""
     req = route.request
     resource_type = req.resource_type
 
@@ -21,64 +204,122 @@ async def intercept_route(route):
         or any(domain in req.url for domain in blocked_domains)
     ):
         await route.abort()
+    elif (
+        network_cache is not None
+        and resource_type in CachedRouter.cached_types
+        and req.method == "GET"
+    ):
+        await network_cache.handle(route)
     else:
         await route.continue_()
 
 
-async def safe_goto(page, url, retries=3, delay=2):
+async def fetch_html(client: httpx.AsyncClient, url: str) -> str:
+    """Fetch a server-rendered page without a browser."""
+    response = await client.get(url)
+    response.raise_for_status()
+    return response.text
 
-    for attempt in range(1, retries + 1):
-        try:
-            await page.route("**/*", lambda route: asyncio.create_task(intercept_route(route)))
-            await page.goto(url, wait_until="domcontentloaded", timeout=5_000 * attempt)
-            return
-        except Exception as e1:
-            try:
-                logger.warning(f"⚠️ Attempt {attempt}/{retries} failed (domcontentloaded) for {url}: {e1}")
-                logger.info(f"Retrying with heavier wait condition...")
-                await page.route("**/*", lambda route: asyncio.create_task(intercept_route(route)))
-                await page.goto(url, wait_until="networkidle", timeout=5_000  * attempt)
-                return
-            except Exception as e2:
-                logger.warning(f"Second attempt (networkidle) failed: {e2}")
-                if attempt < retries:
-                    await asyncio.sleep(delay)
-    raise RuntimeError(f"Failed to load {url} after {retries} attempts")
 
+# Blocked inside Chromium through CDP, so these requests never round-trip to Python.
+# The trailing wildcard also matches versioned urls such as site.css?v=3.
+BLOCKED_URL_PATTERNS = [
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.svg*", "*.css*",
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    "*.mp4*", "*.webm*", "*.mp3*", "*.ogg*",
+    "*google-analytics*", "*doubleclick*", "*facebook.com*",
+]
 
-async def domcontentloaded_safe_goto(page, url, retries=3, delay=2):
-    for attempt in range(1, retries + 1):
+
+def is_wikiart_url(url: str) -> bool:
+    """True for wikiart.org and its subdomains, the only hosts the response cache serves."""
+    host = urlparse(url).hostname or ""
+    return host == "wikiart.org" or host.endswith(".wikiart.org")
+
+
+async def setup_page(context, cdp_blocking: bool = True):
+    """Open a new page that skips images, fonts, stylesheets and trackers.
+
+    On Chromium the blocking is done by the browser through CDP and `intercept_route` is only
+    registered for wikiart.org requests when the response cache needs it; other browsers (or
+    cdp_blocking=False) use `intercept_route` for everything.
+    """
+    page = await context.new_page()
+    browser = context.browser
+    if cdp_blocking and browser is not None and browser.browser_type.name == "chromium":
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        if network_cache is not None:
+            # Only WikiArt responses are cached, so third-party requests skip the Python handler.
+            await page.route(is_wikiart_url, intercept_route)
+        return page
+    await page.route("**/*", intercept_route)
+    return page
+
+
+class PagePool:
+    """Fixed set of pages in one browser context, checked out by one task at a time."""
+
+    def __init__(self, context, pages, cdp_blocking: bool = True):
+        self.context = context
+        self.cdp_blocking = cdp_blocking
+        self._pages: asyncio.Queue = asyncio.Queue()
+        for page in pages:
+            self._pages.put_nowait(page)
+
+    @classmethod
+    async def create(cls, context, size: int, cdp_blocking: bool = True) -> "PagePool":
+        pages = await asyncio.gather(*[setup_page(context, cdp_blocking) for _ in range(size)])
+        return cls(context, pages, cdp_blocking)
+
+    async def acquire(self):
+        return await self._pages.get()
+
+    async def release(self, page):
+        # A page that crashed or was closed mid-task is replaced so the pool keeps its size.
+        if page.is_closed():
+            page = await setup_page(self.context, self.cdp_blocking)
+        self._pages.put_nowait(page)
+
+    @asynccontextmanager
+    async def page(self):
+        page = await self.acquire()
         try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=5_000 * retries)
-            return
-        except Exception as e1:
-            try:
-                logger.warning(f"⚠️ Attempt {attempt}/{retries} failed (domcontentloaded) for {url}: {e1}")
-                logger.info(f"Retrying with heavier wait condition...")
-                await page.goto(url, wait_until="networkidle", timeout=10_000  * retries)
-                return
-            except Exception as e2:
-                logger.warning(f"Second attempt (networkidle) failed: {e2}")
-                if attempt < retries:
-                    await asyncio.sleep(delay)
-    raise RuntimeError(f"Failed to load {url} after {retries} attempts")
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self):
+        await self.context.close()
+
+
+# (wait_until, timeout multiplier) pairs tried in order within each attempt.
+DEFAULT_WAIT_STRATEGY = (("domcontentloaded", 1), ("networkidle", 2))
+
 
+async def safe_goto(
+    page, url, *, strategy=DEFAULT_WAIT_STRATEGY, retries=3, base_timeout_ms=5_000, delay_s=2, total_budget_s=60
+):
+    """Navigate to `url`, falling back through `strategy` and growing the timeout with each attempt.
 
-async def networkidle_safe_goto(page, url, retries=3, delay=2):
+    Every navigation is cut off with asyncio.wait_for once the `total_budget_s` deadline is reached,
+    and the pause between attempts doubles starting from `delay_s`.
+    """
+    deadline = time.monotonic() + total_budget_s
     for attempt in range(1, retries + 1):
-        try:
-            await page.goto(url, wait_until="networkidle", timeout=10_000)
-            return
-        except Exception as e1:
+        for wait_until, multiplier in strategy:
+            remaining_s = deadline - time.monotonic()
+            if remaining_s <= 0:
+                raise RuntimeError(f"Failed to load {url} within {total_budget_s}s")
+            timeout_s = min(base_timeout_ms * multiplier * attempt / 1000, remaining_s)
             try:
-                logger.warning(f"Attempt {attempt}/{retries} failed (networkidle) for {url}: {e1}")
-                logger.info(f"Retrying with lighter wait condition...")
-                await page.goto(url, wait_until="domcontentloaded", timeout=10_000)
+                await asyncio.wait_for(page.goto(url, wait_until=wait_until, timeout=timeout_s * 1000), timeout_s)
                 return
-            except Exception as e2:
-                logger.warning(f"Second attempt (domcontentloaded) failed: {e2}")
-                if attempt < retries:
-                    await asyncio.sleep(delay)
+            except Exception as e:
+                logger.warning(f"⚠️ Attempt {attempt}/{retries} failed ({wait_until}) for {url}: {str(e) or type(e).__name__}")
+        if attempt < retries:
+            await asyncio.sleep(min(delay_s * 2 ** (attempt - 1), max(deadline - time.monotonic(), 0)))
     raise RuntimeError(f"Failed to load {url} after {retries} attempts")
 
 
@@ -88,34 +329,39 @@ async def close_popup_if_present(page):
         await page.wait_for_selector("#close-popup", timeout=5000)
         await page.click("#close-popup")
         await asyncio.sleep(1)
-        logger.info("Closed popup.")
-    except:
+        logger.debug("Closed popup.")
+    except Exception:
         pass
 
 
+# Number of artwork tiles currently rendered in the masonry grid.
+JS_COUNT_TILES = "document.querySelectorAll('ul.masonry-container li, ul.wiki-masonry-container li').length"
+
+
 async def load_all_artworks(page):
     """Keep clicking the 'LOAD MORE' button until all artworks are loaded or hidden."""
     try:
         for i in range(30):  # limit to 30 clicks max to avoid infinite loops
             button = await page.query_selector("a.masonry-load-more-button")
             if not button:
-                logger.info("All artworks loaded (no more button found).")
+                logger.debug("All artworks loaded (no more button found).")
                 break
 
             visible = await button.is_visible()
             if not visible:
-                logger.info("Load more button found but not visible. Scrolling...")
+                logger.debug("Load more button found but not visible. Scrolling...")
                 await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
                 await asyncio.sleep(1)
                 visible = await button.is_visible()
 
             if not visible:
-                logger.info("Button still not visible — stopping loop.")
+                logger.debug("Button still not visible — stopping loop.")
                 break
 
             # Scroll into view just in case
             await button.scroll_into_view_if_needed()
-            logger.info(f"Clicking 'LOAD MORE' ({i+1})...")
+            tile_count: int = await page.evaluate(JS_COUNT_TILES)
+            logger.debug(f"Clicking 'LOAD MORE' ({i + 1})...")
             try:
                 await button.click(timeout=10000)
             except Exception as click_err:
@@ -124,15 +370,29 @@ async def load_all_artworks(page):
                 continue  # retry next loop iteration
 
             # Wait for new content to appear
-            await asyncio.sleep(2.5)
+            try:
+                await page.wait_for_function(f"(prev) => {JS_COUNT_TILES} > prev", arg=tile_count, timeout=8000)
+            except PlaywrightTimeoutError:
+                logger.debug("No new artworks appeared after 'LOAD MORE' — stopping loop.")
+                break
             await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-            await asyncio.sleep(0.5)
 
             # If the button disappears after the click, we’re done
             still_exists = await page.query_selector("a.masonry-load-more-button")
             if not still_exists:
-                logger.info("No more 'LOAD MORE' button visible. Finished loading artworks.")
+                logger.debug("No more 'LOAD MORE' button visible. Finished loading artworks.")
                 break
 
     except Exception as e:
-        logger.warning(f"Load more loop stopped due to error: {e}")
\ No newline at end of file
+        logger.warning(f"Load more loop stopped due to error: {e}")
+
+
+async def scroll_to_bottom(page, max_rounds=8, timeout=2_000):
+    """Scroll down until the page stops growing, to trigger lazy loading."""
+    for _ in range(max_rounds):
+        height: int = await page.evaluate("document.body.scrollHeight")
+        await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
+        try:
+            await page.wait_for_function("(h) => document.body.scrollHeight > h", arg=height, timeout=timeout)
+        except PlaywrightTimeoutError:
+            break
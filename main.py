@@ -1,181 +1,345 @@
 import asyncio
 import json
+from pathlib import Path
 from urllib.parse import urljoin
-from playwright.async_api import async_playwright, Browser, Page, ElementHandle, JSHandle
-from typing import List, Union, Dict
+import httpx
+from playwright.async_api import async_playwright, Browser, BrowserContext, ElementHandle
+from selectolax.lexbor import LexborHTMLParser
+from typing import List, Optional, Set, Tuple, Union, Dict
 import argparse
 from pydantic import Json
-from common import clean_name, load_all_artworks, safe_goto, close_popup_if_present
+from common import (
+    USER_AGENT, PagePool, SeenStore, bounded, clean_name, configure_logging, configure_network_cache, fetch_html,
+    load_all_artworks, open_seen_store, parse_works_count, read_json_lines, safe_goto, scroll_to_bottom,
+    close_popup_if_present,
+)
 from loguru import logger
 
 BASE_URL = "https://www.wikiart.org"
 START_URL = f"{BASE_URL}/en/artists-by-art-movement"
-
-
-
-async def get_art_movements(browser: Browser, header_filter:str):
-    """Return all sub-period movements under a given header."""
-    page: Page = await browser.new_page()
-    logger.info(f"Navigating to {START_URL}...")
-    await safe_goto(page, START_URL)
-    await close_popup_if_present(page)
-    await page.wait_for_selector("li.header span")
-
-    headers: List[ElementHandle] = await page.query_selector_all("li.header span")
+# Upper bound on JSON feed pages per artist, in case the feed never reports completion.
+MAX_JSON_PAGES = 200
+
+# Collect every header with the dotted movement items listed under it, in one round-trip.
+JS_WALK_ALL = """() => Array.from(document.querySelectorAll('li.header span')).map(header => {
+    const items = [];
+    let el = header.parentElement.nextElementSibling;
+    while (el && !el.classList.contains('header')) {
+        if (el.classList.contains('dottedItem')) {
+            const link = el.querySelector('a');
+            if (link) {
+                items.push({
+                    name: link.textContent.trim(),
+                    href: link.getAttribute('href')
+                });
+            }
+        }
+        el = el.nextElementSibling;
+    }
+    return {header: header.textContent.trim(), items: items};
+})"""
+
+# Read name, link, thumbnail and works count of every artist gallery item, in one round-trip.
+JS_EXTRACT_ARTISTS = """(items) => items.map(li => {
+    const a = li.querySelector('div.artist-name a');
+    if (!a) return null;
+    const img = li.querySelector('a.image-wrapper img');
+    const works = li.querySelector('div.works-count');
+    return {
+        name: (a.textContent || '').trim(),
+        href: a.getAttribute('href'),
+        image: img?.getAttribute('src') || 'Unknown',
+        works_count: works ? (works.textContent || '').trim() : 'Unknown'
+    };
+}).filter(Boolean)"""
+
+# Read href, title and image of every visible link matching a selector, in one round-trip.
+JS_EXTRACT_WORKS = """(sel) => Array.from(document.querySelectorAll(sel))
+    .filter(el => el.offsetWidth > 0 || el.offsetHeight > 0)
+    .map(a => {
+        const src = img => img?.getAttribute('src') || img?.getAttribute('data-src') || null;
+        const ownImg = a.querySelector('img');
+        const title = (a.textContent || '').trim()
+            || (ownImg?.getAttribute('title') || ownImg?.getAttribute('alt') || '').trim();
+        return {
+            href: a.getAttribute('href'),
+            title: title,
+            img: src(ownImg) || src(a.closest('li')?.querySelector('img'))
+        };
+    })"""
+
+
+def parse_art_movements(html: str, header_filter: str) -> Optional[List[Dict]]:
+    """Extract sub-period movements from the raw movements page, or None if it has no header list."""
+    headers = LexborHTMLParser(html).css("li.header span")
+    if not headers:
+        return None
     logger.info(f"Found {len(headers)} art movement categories.")
 
     all_movements = []
     for header in headers:
-        header_text: str = (await header.text_content()).strip() 
-        clean_header: str = " ".join(header_text.split())
+        clean_header: str = " ".join(header.text().split())
 
         if header_filter and header_filter.lower() not in clean_header.lower():
             continue
 
         logger.info(f"Found matching header: {clean_header}")
 
-        dotted_items: JSHandle = await page.evaluate_handle(
-            """(header) => {
-                const results = [];
-                let el = header.parentElement.nextElementSibling;
-                while (el && !el.classList.contains('header')) {
-                    if (el.classList.contains('dottedItem')) {
-                        const link = el.querySelector('a');
-                        if (link) {
-                            results.push({
-                                name: link.textContent.trim(),
-                                href: link.getAttribute('href')
-                            });
-                        }
-                    }
-                    el = el.nextElementSibling;
-                }
-                return results;
-            }""",
-            header
-        )
-
-        movements: Json = await dotted_items.json_value()
-        for m in movements:
-            all_movements.append({
-                "name": clean_name(m["name"]),
-                "url": urljoin(BASE_URL, m["href"])
-            })
+        # Same walk as the browser version: siblings of li.header up to the next header.
+        el = header.parent.next
+        while el is not None:
+            classes: List[str] = (el.attributes.get("class") or "").split() if el.tag != "-text" else []
+            if "header" in classes:
+                break
+            if "dottedItem" in classes:
+                link = el.css_first("a")
+                if link:
+                    all_movements.append({
+                        "name": clean_name(link.text().strip()),
+                        "url": urljoin(BASE_URL, link.attributes.get("href") or "")
+                    })
+            el = el.next
 
-    await page.close()
-    logger.info(f"Found {len(all_movements)} movements.")
     return all_movements
 
 
-async def get_artists_for_movement(browser: Browser, movement):
+def parse_artists(html: str, movement: Dict) -> Optional[List[Dict]]:
+    """Extract artists from a raw movement page, or None if none are server-rendered."""
+    artists: List = []
+    for li in LexborHTMLParser(html).css("ul.wiki-artistgallery-container li"):
+        name_tag = li.css_first("div.artist-name a")
+        if not name_tag:
+            continue
+        name: str = name_tag.text().strip()
+        href: str = name_tag.attributes.get("href") or ""
+        # Unrendered AngularJS templates leave placeholders like {{artist.title}}.
+        if not name or "{{" in name or "{{" in href:
+            continue
+        img_tag = li.css_first("a.image-wrapper img")
+        works_tag = li.css_first("div.works-count")
+        works_count: str = works_tag.text().strip() if works_tag else "Unknown"
+
+        artists.append({
+            "name": name,
+            "url": urljoin(BASE_URL, href),
+            "image": (img_tag.attributes.get("src") if img_tag else None) or "Unknown",
+            "works_count": works_count,
+            "works_count_n": parse_works_count(works_count),
+            "movement": movement["name"]
+        })
+
+    return artists or None
+
+
+async def get_art_movements(client: httpx.AsyncClient, pool: PagePool, header_filter: str):
+    """Return all sub-period movements under a given header."""
+    logger.info(f"Fetching {START_URL}...")
+    try:
+        movements: Optional[List[Dict]] = parse_art_movements(await fetch_html(client, START_URL), header_filter)
+    except httpx.HTTPError as e:
+        logger.warning(f"Raw fetch failed for {START_URL}: {e}")
+        movements = None
+
+    if movements is None:
+        logger.info("Movement list not found in raw HTML, falling back to browser.")
+        movements = await browse_art_movements(pool, header_filter)
+
+    logger.info(f"Found {len(movements)} movements.")
+    return movements
+
+
+async def get_artists_for_movement(client: httpx.AsyncClient, pool: PagePool, movement):
     """Get all artists from a given movement page."""
-    page: Page = await browser.new_page()
     try:
+        artists: Optional[List[Dict]] = parse_artists(await fetch_html(client, movement["url"]), movement)
+    except httpx.HTTPError as e:
+        logger.warning(f"Raw fetch failed for {movement['url']}: {e}")
+        artists = None
+
+    if artists is None:
+        logger.info(f"Artists for {movement['name']} not found in raw HTML, falling back to browser.")
+        artists = await browse_artists_for_movement(pool, movement)
+
+    logger.info(f"Found {len(artists)} artists in {movement['name']}")
+    return artists
+
+
+async def browse_art_movements(pool: PagePool, header_filter:str):
+    """Return all sub-period movements under a given header, rendered in the browser."""
+    async with pool.page() as page:
+        logger.info(f"Navigating to {START_URL}...")
+        await safe_goto(page, START_URL)
+        await close_popup_if_present(page)
+        await page.wait_for_selector("li.header span")
+
+        categories: Json = await page.evaluate(JS_WALK_ALL)
+        logger.info(f"Found {len(categories)} art movement categories.")
+
+        all_movements = []
+        for category in categories:
+            clean_header: str = " ".join(category["header"].split())
+
+            if header_filter and header_filter.lower() not in clean_header.lower():
+                continue
+
+            logger.info(f"Found matching header: {clean_header}")
+            for m in category["items"]:
+                all_movements.append({
+                    "name": clean_name(m["name"]),
+                    "url": urljoin(BASE_URL, m["href"])
+                })
+
+        return all_movements
+
+
+async def browse_artists_for_movement(pool: PagePool, movement):
+    """Get all artists from a given movement page, rendered in the browser."""
+    async with pool.page() as page:
         await safe_goto(page, movement["url"])
         await close_popup_if_present(page)
         await page.wait_for_selector("ul.wiki-artistgallery-container li", timeout=10000)
 
-        artist_items: List[ElementHandle] = await page.query_selector_all("ul.wiki-artistgallery-container li.ng-scope")
+        records: Json = await page.locator("ul.wiki-artistgallery-container li.ng-scope").evaluate_all(JS_EXTRACT_ARTISTS)
         artists: List = []
-        for li in artist_items:
-            try:
-                name_tag: Union[ElementHandle, None] = await li.query_selector("div.artist-name a")
-                if not name_tag:
-                    continue
-                name: str = (await name_tag.text_content()).strip()
-                href: Union[str, None] = await name_tag.get_attribute("href")
-                img_tag: Union[ElementHandle, None] = await li.query_selector("a.image-wrapper img")
-                img_url: str = await img_tag.get_attribute("src") if img_tag else "Unknown"
-                works_tag: Union[ElementHandle, None] = await li.query_selector("div.works-count")
-                works_count: str = (await works_tag.text_content()).strip() if works_tag else "Unknown"
-
-                artists.append({
-                    "name": name,
-                    "url": urljoin(BASE_URL, href),
-                    "image": img_url,
-                    "works_count": works_count,
-                    "movement": movement["name"]
-                })
-            except Exception as e:
-                logger.info(f"Error parsing artist: {e}")
+        for record in records:
+            artists.append({
+                "name": record["name"],
+                "url": urljoin(BASE_URL, record["href"] or ""),
+                "image": record["image"],
+                "works_count": record["works_count"],
+                "works_count_n": parse_works_count(record["works_count"]),
+                "movement": movement["name"]
+            })
 
-        logger.info(f"Found {len(artists)} artists in {movement['name']}")
         return artists
-    finally:
-        await page.close()
 
 
-async def get_works_for_artist(browser: Browser, artist: Dict):
-    """Get all works for an artist (with retries and safety)."""
-    page: Page = await browser.new_page()
-    art_works = []
-    artist_name = artist.get("name", "Unknown")
+async def fetch_all_works_json(client: httpx.AsyncClient, artist: Dict) -> Optional[List[Dict]]:
+    """Page through the artist's all-paintings JSON feed, or return None if its shape is unexpected."""
     artist_url = artist.get("url", "").rstrip("/")
+    art_works = []
+    seen_urls = set()
 
+    for page_number in range(1, MAX_JSON_PAGES + 1):
+        response = await client.get(
+            f"{artist_url}/mode/all-paintings",
+            params={"json": 2, "layout": "new", "page": page_number, "resultType": "masonry"},
+        )
+        response.raise_for_status()
+        data = response.json()
+        if not isinstance(data, dict) or not isinstance(data.get("Paintings"), list):
+            return None
+
+        known = len(seen_urls)
+        for painting in data["Paintings"]:
+            href: Union[str, None] = painting.get("paintingUrl")
+            if not href:
+                continue
+            full_url: str = urljoin(BASE_URL, href)
+            if full_url in seen_urls:
+                continue
+            seen_urls.add(full_url)
+
+            art_works.append({
+                "title": (painting.get("title") or "").strip() or "Unknown",
+                "url": full_url,
+                "image": painting.get("image") or "Unknown",
+                "artist": artist.get("name"),
+                "movement": artist.get("movement"),
+            })
+
+        # An empty page, or one that only repeats earlier works (the feed ignoring `page`), ends the feed.
+        total = data.get("AllPaintingsCount")
+        if len(seen_urls) == known or data.get("AllPaintingsHaveBeenLoaded") or (total and len(seen_urls) >= total):
+            break
+
+    return art_works
+
+
+async def get_works_for_artist(client: httpx.AsyncClient, pool: PagePool, artist: Dict) -> Tuple[List[Dict], bool]:
+    """Get all works for an artist, from the JSON feed when it is available.
+
+    Also returns whether the list is known to be complete, which is only the case for the JSON feed:
+    the browser fallback can stop early (LOAD MORE timing out, a failed navigation).
+    """
+    artist_name = artist.get("name", "Unknown")
     try:
-        logger.info(f"Scraping art works for: {artist_name}")
-        await safe_goto(page, artist_url)
-        await close_popup_if_present(page)
+        art_works: Optional[List[Dict]] = await fetch_all_works_json(client, artist)
+    except (httpx.HTTPError, ValueError) as e:
+        logger.debug(f"JSON feed failed for {artist_name}: {e}")
+        art_works = None
+
+    if not art_works:
+        logger.debug(f"No JSON feed for {artist_name}, falling back to browser.")
+        return await browse_works_for_artist(pool, artist), False
+
+    logger.info(f"Found {len(art_works)} art works for {artist_name}")
+    return art_works, True
 
-        # Handle "View all artworks" link
+
+async def browse_works_for_artist(pool: PagePool, artist: Dict):
+    """Get all works for an artist by rendering the listing in the browser (with retries and safety)."""
+    art_works = []
+    artist_name = artist.get("name", "Unknown")
+    artist_url = artist.get("url", "").rstrip("/")
+
+    async with pool.page() as page:
         try:
-            view_all = await page.query_selector("a.btn-view-all")
-            if view_all:
-                href: Union[ElementHandle, None] = await view_all.get_attribute("href")
-                if href and not href.startswith("javascript:") and not href.startswith("#"):
-                    full_url: str = href if href.startswith("http") else urljoin(BASE_URL, href)
-                    logger.info(f"Found 'View all artworks' link → Navigating to {full_url}")
-                    await safe_goto(page, full_url)
-                    await close_popup_if_present(page)
-        except Exception as e:
-            logger.info(f"No 'View all artworks' button for {artist_name} ({e})")
-
-        # Fallback to "all works" page if necessary
-        current_url = page.url
-        if "all-works" not in current_url:
-            alt_url = f"{artist_url}/all-works#!#filterName:all-works,resultType:masonry"
-            logger.info(f"Loading all works page: {alt_url}")
-            await safe_goto(page, alt_url)
+            logger.debug(f"Scraping art works for: {artist_name}")
+            await safe_goto(page, artist_url)
             await close_popup_if_present(page)
 
-        # Ensure all works are loaded (click "LOAD MORE" until done)
-        await load_all_artworks(page)
-
-        # Lazy-load by scrolling (trigger dynamic loading)
-        for _ in range(8):
-            await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-            await asyncio.sleep(0.8)
-
-        # Try multiple possible selectors
-        selectors = [
-            "a.artwork-name",
-            "ul.wiki-masonry-container li a",
-            "ul.masonry-container li a",
-            "ul.painting-list-text li a",
-            "li.painting-list-text-row a",
-            "ul.masonry-list li a",
-            "ul.masonry-list-text li a",
-        ]
-
-        nodes = []
-        for sel in selectors:
-            nodes: List[ElementHandle] = await page.query_selector_all(sel)
-            if nodes:
-                nodes = [
-                    n for n in nodes
-                    if await n.evaluate("el => el.offsetWidth > 0 || el.offsetHeight > 0")
-                ]
-            if nodes:
-                break
+            # Handle "View all artworks" link
+            try:
+                view_all = await page.query_selector("a.btn-view-all")
+                if view_all:
+                    href: Union[ElementHandle, None] = await view_all.get_attribute("href")
+                    if href and not href.startswith("javascript:") and not href.startswith("#"):
+                        full_url: str = href if href.startswith("http") else urljoin(BASE_URL, href)
+                        logger.debug(f"Found 'View all artworks' link → Navigating to {full_url}")
+                        await safe_goto(page, full_url)
+                        await close_popup_if_present(page)
+            except Exception as e:
+                logger.debug(f"No 'View all artworks' button for {artist_name} ({e})")
+
+            # Fallback to "all works" page if necessary
+            current_url = page.url
+            if "all-works" not in current_url:
+                alt_url = f"{artist_url}/all-works#!#filterName:all-works,resultType:masonry"
+                logger.debug(f"Loading all works page: {alt_url}")
+                await safe_goto(page, alt_url)
+                await close_popup_if_present(page)
+
+            # Ensure all works are loaded (click "LOAD MORE" until done)
+            await load_all_artworks(page)
+
+            # Lazy-load by scrolling (trigger dynamic loading)
+            await scroll_to_bottom(page)
+
+            # Try multiple possible selectors
+            selectors = [
+                "a.artwork-name",
+                "ul.wiki-masonry-container li a",
+                "ul.masonry-container li a",
+                "ul.painting-list-text li a",
+                "li.painting-list-text-row a",
+                "ul.masonry-list li a",
+                "ul.masonry-list-text li a",
+            ]
 
-        if not nodes:
-            logger.info(f"No art works found for {artist_name}")
-            return art_works
+            records: Json = []
+            for sel in selectors:
+                records = await page.evaluate(JS_EXTRACT_WORKS, sel)
+                if records:
+                    break
 
-        seen_urls = set()
-        for a in nodes:
-            try:
-                href: Union[str, None] = await a.get_attribute("href")
+            if not records:
+                logger.info(f"No art works found for {artist_name}")
+                return art_works
+
+            seen_urls = set()
+            for record in records:
+                href: Union[str, None] = record["href"]
                 if not href or href.startswith("javascript:") or href.startswith("#"):
                     continue
 
@@ -184,67 +348,44 @@ async def get_works_for_artist(browser: Browser, artist: Dict):
                     continue
                 seen_urls.add(full_url)
 
-                # Extract title text
-                title: str = (await a.text_content() or "").strip()
-                if not title:
-                    img: Union[ElementHandle, None] = await a.query_selector("img")
-                    if img:
-                        title = (
-                            (await img.get_attribute("title"))
-                            or (await img.get_attribute("alt"))
-                            or ""
-                        ).strip()
-
-                # Extract image URL with fallbacks
-                img_url = None
-                img: Union[ElementHandle, None] = await a.query_selector("img")
-                if img:
-                    img_url: Union[str, None] = await img.get_attribute("src") or await img.get_attribute("data-src")
-
-                if not img_url:
-                    parent_li: JSHandle = await a.evaluate_handle("el => el.closest('li')")
-                    if parent_li:
-                        img2: Union[ElementHandle, None] = await parent_li.query_selector("img")
-                        if img2:
-                            img_url = await img2.get_attribute("src") or await img2.get_attribute("data-src")
-
                 art_works.append({
-                    "title": title or "Unknown",
+                    "title": record["title"] or "Unknown",
                     "url": full_url,
-                    "image": img_url or "Unknown",
+                    "image": record["img"] or "Unknown",
                     "artist": artist.get("name"),
                     "movement": artist.get("movement"),
                 })
 
-            except Exception as e:
-                logger.info(f"Error parsing art works for {artist_name}: {e}")
-                continue
+            logger.info(f"Found {len(art_works)} art works for {artist_name}")
+            return art_works
+
+        except Exception as e:
+            logger.info(f"Error scraping art works for {artist_name}: {e}")
+            return art_works
 
-        logger.info(f"Found {len(art_works)} art works for {artist_name}")
-        return art_works
 
-    except Exception as e:
-        logger.info(f"Error scraping art works for {artist_name}: {e}")
-        return art_works
-    finally:
-        await page.close()
 
+async def get_location(pool: PagePool, art_work_url: str) -> Optional[str]:
+    """Fetch the current location of an art work, "Unknown" if it has none, or None if the page failed to load."""
+    async with pool.page() as page:
+        try:
+            await safe_goto(page, art_work_url)
+            await asyncio.sleep(1)
+            loc_el: Union[ElementHandle, None] = await page.query_selector("li.dictionary-values-gallery span")
+            if loc_el:
+                return (await loc_el.text_content()).strip()
+        except Exception as e:
+            logger.warning(f"Could not look up the location of {art_work_url}: {e}")
+            return None
+        return "Unknown"
 
 
-async def get_location(browser: Browser, art_work_url: str):
-    """Fetch the current location of an art work (if available)."""
-    page: Page = await browser.new_page()
-    try:
-        await safe_goto(page, art_work_url)
-        await asyncio.sleep(1)
-        loc_el: Union[ElementHandle, None] = await page.query_selector("li.dictionary-values-gallery span")
-        if loc_el:
-            return (await loc_el.text_content()).strip()
-    except:
-        pass
-    finally:
-        await page.close()
-    return "Unknown"
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def parse_args():
@@ -263,14 +404,44 @@ def parse_args():
         action="store_true",
         help="If set, export results to JSON file.",
     )
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Serve previously fetched pages from the on-disk cache in .network-cache/ (a development aid).",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=24 * 3600,
+        help="Seconds a cached page stays valid (default: one day).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log per-page and per-click progress (DEBUG level).",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=positive_int,
+        default=5,
+        help="Maximum number of pages scraped at the same time.",
+    )
     return parser.parse_args()
 
 
-async def main(movement: str, export: bool):
+async def main(
+    movement: str, export: bool, max_concurrency: int = 5, cache: bool = False, cache_ttl: float = 24 * 3600
+):
     
     logger.info(f"Getting art works for art movement: {movement}")
+    configure_network_cache(cache, ttl=cache_ttl)
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-    async with async_playwright() as p:
+    async with (
+        async_playwright() as p,
+        httpx.AsyncClient(http2=True, timeout=10, follow_redirects=True, headers={"User-Agent": USER_AGENT}) as client,
+    ):
         browser: Browser  = await p.chromium.launch(
             headless=True,
             args=[
@@ -283,31 +454,95 @@ async def main(movement: str, export: bool):
             ]
         )
 
-        movements: List = await get_art_movements(browser, header_filter=movement)
-        all_artists, all_art_works = [], []
+        # The movement list is server-rendered, so its fallback page needs no JavaScript; artist
+        # galleries and art work listings are built by AngularJS and keep it enabled.
+        static_context: BrowserContext = await browser.new_context(java_script_enabled=False, service_workers="block")
+        static_pool: PagePool = await PagePool.create(static_context, size=1)
+        context: BrowserContext = await browser.new_context(java_script_enabled=True, service_workers="block")
+        pool: PagePool = await PagePool.create(context, size=max_concurrency)
 
-        for mv in movements:
-            artists: List = await get_artists_for_movement(browser, mv)
-            all_artists.extend(artists)
-            for artist in artists:
-                art_works: List = await get_works_for_artist(browser, artist)
-                for art_work in art_works:
-                    art_work["location"] = await get_location(browser, art_work["url"])
-                    all_art_works.append(art_work)
+        movements: List = await get_art_movements(client, static_pool, header_filter=movement)
+
+        # Each stage fans out over the previous one; the semaphore caps open pages.
+        # A TaskGroup cancels every in-flight page if one task fails or the run is interrupted.
+        async with asyncio.TaskGroup() as tg:
+            movement_tasks = [
+                tg.create_task(bounded(semaphore, get_artists_for_movement(client, pool, mv))) for mv in movements
+            ]
+        # An artist listed under several movements is scraped once, under the first of them.
+        artists_by_url: Dict[str, Dict] = {}
+        for task in movement_tasks:
+            for artist in task.result():
+                artists_by_url.setdefault(artist["url"], artist)
+        all_artists: List = list(artists_by_url.values())
+        # Small artists first, so progress through the list is roughly even.
+        all_artists.sort(key=lambda a: a["works_count_n"])
+
+        # Art works are appended to disk as soon as their location is known, and their urls are
+        # recorded in a sqlite store next to the file, so later runs skip what is already there.
+        output_path = Path(f"{movement} wikiart art works.jsonl")
+        seen: SeenStore = open_seen_store(output_path)
+        if len(seen):
+            logger.info(f"Resuming: {len(seen)} art works already in {output_path}")
+        in_flight: Set[str] = set()
+
+        with output_path.open("a", buffering=1, encoding="utf-8") as out:
+
+            async def scrape_art_work(art_work: Dict) -> bool:
+                location: Optional[str] = await bounded(semaphore, get_location(pool, art_work["url"]))
+                if location is None:
+                    # Not written, so the next run looks it up again.
+                    in_flight.discard(art_work["url"])
+                    return False
+                art_work["location"] = location
+                out.write(json.dumps(art_work, ensure_ascii=False) + "\n")
+                out.flush()
+                seen.add(art_work["url"])
+                in_flight.discard(art_work["url"])
+                return True
+
+            async def scrape_artist(artist: Dict) -> int:
+                if artist["works_count_n"] == 0 or seen.artist_done(artist["url"]):
+                    return 0
+                art_works, complete = await bounded(semaphore, get_works_for_artist(client, pool, artist))
+                # Works shared with another artist's listing are scraped once.
+                new_works: List = [w for w in art_works if w["url"] not in in_flight and w["url"] not in seen]
+                in_flight.update(w["url"] for w in new_works)
+                async with asyncio.TaskGroup() as tg:
+                    work_tasks = [tg.create_task(scrape_art_work(w)) for w in new_works]
+                # Only skip this artist in later runs once every listed work is on disk.
+                if complete and art_works and all(w["url"] in seen for w in art_works):
+                    seen.mark_artist_done(artist["url"])
+                return sum(task.result() for task in work_tasks)
+
+            # The semaphore is FIFO, so without a separate cap every artist listing would be queued
+            # ahead of the first location lookup. Few artists at a time keeps works streaming to disk.
+            artist_slots = asyncio.Semaphore(max(1, max_concurrency // 2))
+            async with asyncio.TaskGroup() as tg:
+                artist_tasks = [
+                    tg.create_task(bounded(artist_slots, scrape_artist(artist))) for artist in all_artists
+                ]
+            new_counts: List[int] = [task.result() for task in artist_tasks]
 
         logger.info(f"\nTotal artists collected: {len(all_artists)}")
-        logger.info(f"Total art works collected: {len(all_art_works)}")
+        logger.info(f"Total art works collected: {sum(new_counts)} new, {len(seen)} in {output_path}")
+        seen.close()
 
         if export:
             file_name = f"{movement} wikiart data.json"
-            data = {"artists": all_artists, "art works": all_art_works}
+            data = {"artists": all_artists, "art works": list(read_json_lines(output_path))}
             with open(file_name, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=4)
             logger.info(f"Data saved to {file_name}")
 
+        await static_pool.close()
+        await pool.close()
         await browser.close()
 
+    await logger.complete()
+
 
 if __name__ == "__main__":
     args = parse_args()
-    asyncio.run(main(args.movement, args.export))
+    configure_logging(args.verbose)
+    asyncio.run(main(args.movement, args.export, args.max_concurrency, args.cache, args.cache_ttl))
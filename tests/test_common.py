@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from common import SeenStore, open_seen_store, parse_works_count, read_json_lines
+
+
+def write_lines(path, *lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+
+
+def test_read_json_lines_missing_file_yields_nothing(tmp_path):
+    assert list(read_json_lines(tmp_path / "missing.jsonl")) == []
+
+
+def test_read_json_lines_skips_blank_and_truncated_lines(tmp_path):
+    path = tmp_path / "works.jsonl"
+    write_lines(path, json.dumps({"url": "a"}), "", json.dumps({"url": "b"}), '{"url": "c')
+
+    assert [record["url"] for record in read_json_lines(path)] == ["a", "b"]
+
+
+def test_seen_store_persists_across_instances(tmp_path):
+    path = tmp_path / "works.seen.sqlite3"
+    store = SeenStore(path)
+    store.add_many(["a", "b", "a"])
+    store.mark_artist_done("https://www.wikiart.org/en/giotto")
+    store.close()
+
+    store = SeenStore(path)
+    try:
+        assert len(store) == 2
+        assert "a" in store and "c" not in store
+        assert store.artist_done("https://www.wikiart.org/en/giotto")
+        assert not store.artist_done("https://www.wikiart.org/en/cimabue")
+    finally:
+        store.close()
+
+
+def test_open_seen_store_seeds_from_existing_output(tmp_path):
+    output_path = tmp_path / "works.jsonl"
+    write_lines(output_path, json.dumps({"url": "a"}), json.dumps({"url": "b"}))
+
+    store = open_seen_store(output_path)
+    try:
+        assert len(store) == 2
+        assert "a" in store and "b" in store
+    finally:
+        store.close()
+
+
+def test_open_seen_store_resets_when_output_is_gone(tmp_path):
+    output_path = tmp_path / "works.jsonl"
+    store = SeenStore(output_path.with_suffix(".seen.sqlite3"))
+    store.add("a")
+    store.mark_artist_done("https://www.wikiart.org/en/giotto")
+    store.close()
+
+    store = open_seen_store(output_path)
+    try:
+        assert len(store) == 0
+        assert not store.artist_done("https://www.wikiart.org/en/giotto")
+    finally:
+        store.close()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1,205 artworks", 1205),
+    (" 42 ", 42),
+    ("0 artworks", 0),
+    ("Unknown", -1),
+    ("", -1),
+])
+def test_parse_works_count(text, expected):
+    assert parse_works_count(text) == expected
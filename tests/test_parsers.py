@@ -0,0 +1,69 @@
+from pathlib import Path
+
+from main import parse_art_movements, parse_artists
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def read_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def test_parse_art_movements_keeps_items_under_matching_header():
+    movements = parse_art_movements(read_fixture("artists_by_art_movement.html"), "renaissance")
+
+    assert movements == [
+        {
+            "name": "Early Renaissance",
+            "url": "https://www.wikiart.org/en/artists-by-art-movement/early-renaissance",
+        },
+        {
+            "name": "Mannerism (Late Renaissance)",
+            "url": "https://www.wikiart.org/en/artists-by-art-movement/mannerism-late-renaissance",
+        },
+    ]
+
+
+def test_parse_art_movements_without_filter_returns_every_header():
+    movements = parse_art_movements(read_fixture("artists_by_art_movement.html"), "")
+
+    assert [movement["name"] for movement in movements] == [
+        "Romanesque", "Gothic", "Early Renaissance", "Mannerism (Late Renaissance)",
+    ]
+
+
+def test_parse_art_movements_returns_none_without_header_list():
+    assert parse_art_movements("<html><body><p>Loading...</p></body></html>", "") is None
+
+
+def test_parse_artists_reads_rendered_gallery():
+    artists = parse_artists(read_fixture("movement_artists.html"), {"name": "Proto Renaissance"})
+
+    assert artists == [
+        {
+            "name": "Giotto",
+            "url": "https://www.wikiart.org/en/giotto",
+            "image": "https://uploads.wikiart.org/giotto.jpg",
+            "works_count": "1,205 artworks",
+            "works_count_n": 1205,
+            "movement": "Proto Renaissance",
+        },
+        {
+            "name": "Cimabue",
+            "url": "https://www.wikiart.org/en/cimabue",
+            "image": "Unknown",
+            "works_count": "Unknown",
+            "works_count_n": -1,
+            "movement": "Proto Renaissance",
+        },
+    ]
+
+
+def test_parse_artists_returns_none_for_unrendered_template():
+    html = (
+        '<ul class="wiki-artistgallery-container"><li>'
+        '<div class="artist-name"><a href="{{artist.artistUrl}}">{{artist.title}}</a></div>'
+        "</li></ul>"
+    )
+
+    assert parse_artists(html, {"name": "Proto Renaissance"}) is None